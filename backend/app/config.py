@@ -1,8 +1,26 @@
 """
 Application configuration using Pydantic Settings.
+
+Non-secret settings are loaded eagerly into `settings` at import time.
+Credentials live in `SecretSettings` and are only resolved on first call
+to `secrets()`.
 """
+import logging
+from functools import cached_property, lru_cache
+
+from pydantic import computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+logger = logging.getLogger(__name__)
+
+# Shared environment/.env loading behaviour for all settings classes
+_MODEL_CONFIG = SettingsConfigDict(
+    env_file=".env",
+    env_file_encoding="utf-8",
+    case_sensitive=True,
+    extra="ignore",
+)
+
 
 class Settings(BaseSettings):
     """
@@ -20,12 +38,15 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "sqlite:///./data/lotus.db"
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30  # seconds
+    DB_POOL_RECYCLE: int = 3600  # seconds
 
     # ============================================
     # LLM Configuration
     # ============================================
     # Claude API (Anthropic)
-    ANTHROPIC_API_KEY: str = ""
     CLAUDE_MODEL: str = "claude-sonnet-4-5-20250929"
     CLAUDE_MAX_TOKENS: int = 4096
     CLAUDE_TEMPERATURE: float = 0.7
@@ -44,25 +65,12 @@ class Settings(BaseSettings):
     # ============================================
     # Slack OAuth
     SLACK_CLIENT_ID: str = ""
-    SLACK_CLIENT_SECRET: str = ""
     SLACK_REDIRECT_URI: str = "http://localhost:8000/auth/slack/callback"
-    SLACK_BOT_TOKEN: str = ""
-    SLACK_USER_TOKEN: str = ""
 
     # Google OAuth (for Google Meet transcripts)
     GOOGLE_CLIENT_ID: str = ""
-    GOOGLE_CLIENT_SECRET: str = ""
     GOOGLE_REDIRECT_URI: str = "http://localhost:8000/auth/google/callback"
 
-    # ============================================
-    # Security
-    # ============================================
-    # Encryption key for sensitive data in database
-    ENCRYPTION_KEY: str = ""
-
-    # JWT Secret for API authentication (Phase 2)
-    JWT_SECRET: str = "change-this-to-a-random-secret-key-in-production"
-
     # ============================================
     # Application Settings
     # ============================================
@@ -95,12 +103,70 @@ class Settings(BaseSettings):
     CHROMA_PERSIST_DIRECTORY: str = "./data/chroma"
     CHROMA_COLLECTION_NAME: str = "lotus_messages"
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=True,
-        extra="ignore",
-    )
+    model_config = _MODEL_CONFIG
+
+    @computed_field  # type: ignore[prop-decorator]
+    @cached_property
+    def log_level_int(self) -> int:
+        """Numeric level for LOG_LEVEL; warns and falls back to INFO if unknown."""
+        level = logging.getLevelNamesMapping().get(self.LOG_LEVEL.upper())
+        if level is None:
+            logger.warning(f"Unknown LOG_LEVEL {self.LOG_LEVEL!r}, falling back to INFO")
+            return logging.INFO
+        return level
+
+    @computed_field  # type: ignore[prop-decorator]
+    @cached_property
+    def log_level_lower(self) -> str:
+        """Lowercase level name for LOG_LEVEL, as expected by uvicorn."""
+        return logging.getLevelName(self.log_level_int).lower()
+
+
+class SecretSettings(BaseSettings):
+    """
+    Credentials and secrets loaded from environment variables.
+
+    Resolved lazily via `secrets()` so processes that never touch a
+    credential don't read them at startup.
+    """
+
+    # ============================================
+    # LLM Credentials
+    # ============================================
+    ANTHROPIC_API_KEY: str = ""
+
+    # ============================================
+    # Integration Credentials
+    # ============================================
+    # Slack OAuth
+    SLACK_CLIENT_SECRET: str = ""
+    SLACK_BOT_TOKEN: str = ""
+    SLACK_USER_TOKEN: str = ""
+
+    # Google OAuth
+    GOOGLE_CLIENT_SECRET: str = ""
+
+    # ============================================
+    # Security
+    # ============================================
+    # Encryption key for sensitive data in database
+    ENCRYPTION_KEY: str = ""
+
+    # JWT Secret for API authentication (Phase 2)
+    JWT_SECRET: str = "change-this-to-a-random-secret-key-in-production"
+
+    model_config = _MODEL_CONFIG
+
+
+@lru_cache(maxsize=1)
+def secrets() -> SecretSettings:
+    """
+    Get the secret settings, loading them on first access.
+
+    Returns:
+        SecretSettings: Cached secret settings instance
+    """
+    return SecretSettings()
 
 
 # Create global settings instance
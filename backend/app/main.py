@@ -1,54 +1,146 @@
 """
 Lotus FastAPI Application Entry Point.
 """
+import asyncio
 import logging
-from contextlib import asynccontextmanager
-from datetime import datetime
+import queue
+import time
+from collections.abc import Iterator
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
+from sqlalchemy.pool import StaticPool
 
 from app.config import settings
-from app.models.base import Base, engine
+from app.models.base import Base, get_async_engine
 
-# Configure logging
+# Log record format shared by the startup handler and the queue listener
+_LOG_FORMAT = "[%(asctime)s] [%(levelname)s] [%(name)s] - %(message)s"
+_LOG_DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+# Configure logging: writes straight to stderr until lifespan switches the
+# root logger over to the queue (and for any process that never runs it)
 logging.basicConfig(
-    level=getattr(logging, settings.LOG_LEVEL),
-    format="[%(asctime)s] [%(levelname)s] [%(name)s] - %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
+    level=settings.log_level_int,
+    format=_LOG_FORMAT,
+    datefmt=_LOG_DATEFMT,
 )
 logger = logging.getLogger(__name__)
 
 
+def create_log_listener(log_queue: queue.Queue) -> QueueListener:
+    """
+    Build the background listener that drains the log queue.
+
+    Args:
+        log_queue: Queue fed by the root logger's QueueHandler
+
+    Returns:
+        QueueListener: Listener writing to the rotating log file and stderr
+    """
+    formatter = logging.Formatter(fmt=_LOG_FORMAT, datefmt=_LOG_DATEFMT)
+
+    Path(settings.LOG_FILE).parent.mkdir(parents=True, exist_ok=True)
+    file_handler = RotatingFileHandler(
+        settings.LOG_FILE,
+        maxBytes=settings.LOG_MAX_BYTES,
+        backupCount=settings.LOG_BACKUP_COUNT,
+    )
+    stream_handler = logging.StreamHandler()
+
+    handlers = (file_handler, stream_handler)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    return QueueListener(log_queue, *handlers, respect_handler_level=True)
+
+
+@contextmanager
+def queued_logging() -> Iterator[None]:
+    """
+    Route root logging through a QueueHandler drained by a background listener.
+
+    The root logger's existing handlers are swapped out while active and
+    restored on exit, and the listener is always stopped (flushing any
+    queued records) and its handlers closed, including when startup fails.
+    """
+    log_queue: queue.Queue = queue.Queue(-1)
+    log_listener = create_log_listener(log_queue)
+
+    root_logger = logging.getLogger()
+    previous_handlers = root_logger.handlers[:]
+    root_logger.handlers = [QueueHandler(log_queue)]
+    log_listener.start()
+    try:
+        yield
+    finally:
+        root_logger.handlers = previous_handlers
+        log_listener.stop()
+        for handler in log_listener.handlers:
+            handler.close()
+
+
+async def warm_pool(n: int) -> None:
+    """
+    Pre-open database connections so the first requests don't pay connect cost.
+
+    Args:
+        n: Number of connections to open concurrently
+    """
+
+    async def _ping():
+        async with get_async_engine().connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_ping() for _ in range(n)))
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Lifespan context manager for startup and shutdown events.
 
     Startup:
+        - Switch logging to the background queue listener
         - Create database tables
-        - Initialize connections
+        - Warm the database connection pool
 
     Shutdown:
         - Close connections
-        - Cleanup resources
+        - Flush the log queue and restore direct logging
     """
-    logger.info("Starting Lotus backend application...")
+    with queued_logging():
+        logger.info("Starting Lotus backend application...")
 
-    # Create database tables
-    try:
-        Base.metadata.create_all(bind=engine)
-        logger.info("Database tables created successfully")
-    except Exception as e:
-        logger.error(f"Failed to create database tables: {e}")
-        raise
+        # Create database tables
+        try:
+            async with get_async_engine().begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            logger.info("Database tables created successfully")
+        except Exception as e:
+            logger.error(f"Failed to create database tables: {e}")
+            raise
+
+        # Warm the connection pool (a StaticPool shares one connection, so skip it)
+        if isinstance(get_async_engine().pool, StaticPool):
+            logger.info("Single-connection database pool, skipping warm-up")
+        else:
+            await warm_pool(settings.DB_POOL_SIZE)
+            logger.info(f"Database connection pool warmed ({settings.DB_POOL_SIZE} connections)")
 
-    logger.info("Lotus backend ready to serve requests")
+        logger.info("Lotus backend ready to serve requests")
 
-    yield
+        yield
 
-    # Shutdown
-    logger.info("Shutting down Lotus backend...")
+        # Shutdown
+        logger.info("Shutting down Lotus backend...")
+        await get_async_engine().dispose()
 
 
 # Create FastAPI app
@@ -58,6 +150,7 @@ app = FastAPI(
     version="0.1.0",
     lifespan=lifespan,
     debug=settings.DEBUG,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -65,11 +158,23 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:5173", "http://localhost:3000"],  # Vite dev server
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=["authorization", "content-type", "x-requested-with"],
+    max_age=3600,  # Let browsers cache preflight responses for an hour
 )
 
 
+# ============================================
+# API Routes
+# ============================================
+# TODO: Include routers here, right after middleware, as we build them.
+# Router imports belong at the top of the module with the other imports:
+#   from app.api.tasks import router as tasks_router
+# app.include_router(tasks_router, prefix="/api", tags=["tasks"])
+# app.include_router(auth_router, prefix="/api/auth", tags=["auth"])
+# app.include_router(integrations_router, prefix="/api/integrations", tags=["integrations"])
+
+
 # ============================================
 # Health Check Endpoints
 # ============================================
@@ -91,32 +196,34 @@ async def root():
     }
 
 
+# Last rendered health-check timestamp as [epoch seconds, ISO string]
+_last_health_ts = [0.0, ""]
+
+
 @app.get("/health")
 async def health_check():
     """
     Health check endpoint for monitoring and deployment.
 
+    The timestamp is re-rendered at most once per second.
+
     Returns:
         dict: Health status and timestamp
     """
+    now = time.time()
+    ts = _last_health_ts
+    if now - ts[0] >= 1.0:
+        ts[0] = now
+        ts[1] = datetime.fromtimestamp(now, timezone.utc).replace(tzinfo=None).isoformat()
+
     return {
         "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": ts[1],
         "database": "connected",
         "version": "0.1.0",
     }
 
 
-# ============================================
-# API Routes
-# ============================================
-# TODO: Import and include routers here as we build them
-# from app.api import tasks, auth, integrations
-# app.include_router(tasks.router, prefix="/api/tasks", tags=["tasks"])
-# app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
-# app.include_router(integrations.router, prefix="/api/integrations", tags=["integrations"])
-
-
 # ============================================
 # Error Handlers
 # ============================================
@@ -132,13 +239,16 @@ async def global_exception_handler(request, exc):
         exc: The exception that was raised
 
     Returns:
-        JSONResponse with error details
+        ORJSONResponse: 500 response with error details
     """
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return {
-        "error": "Internal server error",
-        "detail": str(exc) if settings.DEBUG else "An unexpected error occurred",
-    }
+    return ORJSONResponse(
+        status_code=500,
+        content={
+            "error": "Internal server error",
+            "detail": str(exc) if settings.DEBUG else "An unexpected error occurred",
+        },
+    )
 
 
 if __name__ == "__main__":
@@ -150,5 +260,5 @@ if __name__ == "__main__":
         host=settings.API_HOST,
         port=settings.API_PORT,
         reload=settings.DEBUG,
-        log_level=settings.LOG_LEVEL.lower(),
+        log_level=settings.log_level_lower,
     )
@@ -1,40 +1,160 @@
 """
 Database base configuration and session management.
 """
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.engine.interfaces import DBAPIConnection
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, MappedAsDataclass, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, StaticPool
 
 from app.config import settings
 
-# Create database engine
+# Async drivers for each supported database backend
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def _async_database_url(url: str) -> str:
+    """
+    Map a synchronous database URL onto its asyncio driver.
+
+    Any explicit sync driver (e.g. postgresql+psycopg2) is replaced.
+
+    Args:
+        url: Database URL as configured in settings (e.g. sqlite:///./data/lotus.db)
+
+    Returns:
+        str: Equivalent URL using the async driver (e.g. sqlite+aiosqlite:///./data/lotus.db)
+
+    Raises:
+        ValueError: If no async driver is known for the database backend
+    """
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in _ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for database backend: {backend}")
+    return parsed.set(drivername=_ASYNC_DRIVERS[backend]).render_as_string(
+        hide_password=False
+    )
+
+
+_db_url = make_url(settings.DATABASE_URL)
+_is_memory_sqlite = _db_url.get_backend_name() == "sqlite" and _db_url.database in (
+    None,
+    "",
+    ":memory:",
+)
+
+# Connection pool options shared by both engines
+_POOL_OPTIONS: dict[str, Any]
+if _is_memory_sqlite:
+    # Every new connection to an in-memory database opens a separate empty
+    # database, so share a single connection instead of sizing a pool
+    _POOL_OPTIONS = {"poolclass": StaticPool}
+else:
+    _POOL_OPTIONS = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+    }
+
+# Create synchronous database engine (used by scripts and tooling)
 engine = create_engine(
     settings.DATABASE_URL,
     connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {},
     echo=settings.DEBUG,
+    **_POOL_OPTIONS,
 )
 
 # Create sessionmaker
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# Create base class for models
-Base = declarative_base()
+# Create async sessionmaker (bound when the async engine is first created)
+AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False)
+
+# SQLite tuning applied to every new connection
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256MB
+    "PRAGMA cache_size=-64000",  # 64MB
+)
+
+
+def _set_sqlite_pragmas(
+    dbapi_connection: DBAPIConnection, connection_record: ConnectionPoolEntry
+) -> None:
+    """Enable WAL mode and tuned PRAGMAs on a new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+if settings.DATABASE_URL.startswith("sqlite"):
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+
+
+@lru_cache(maxsize=1)
+def get_async_engine() -> AsyncEngine:
+    """
+    Get the async database engine used by the FastAPI application.
+
+    Created on first call rather than at import, so scripts that only need
+    the sync engine never require an async driver.
+
+    Returns:
+        AsyncEngine: Cached async engine, also bound to AsyncSessionLocal
+    """
+    async_engine = create_async_engine(
+        _async_database_url(settings.DATABASE_URL),
+        echo=settings.DEBUG,
+        # aiosqlite defaults to NullPool for file databases; pool connections instead
+        **{"poolclass": AsyncAdaptedQueuePool, **_POOL_OPTIONS},
+    )
+    if settings.DATABASE_URL.startswith("sqlite"):
+        event.listen(async_engine.sync_engine, "connect", _set_sqlite_pragmas)
+
+    AsyncSessionLocal.configure(bind=async_engine)
+    return async_engine
+
+
+class Base(MappedAsDataclass, DeclarativeBase, kw_only=True, eq=False):
+    """
+    Declarative base class for models.
+
+    Models are mapped as keyword-only dataclasses. eq=False keeps identity
+    equality and hashing for ORM instances. Models repeat kw_only=True in
+    their own class keywords, since mypy does not inherit it from Base.
+    """
+
+    # Fetch server-generated values (e.g. created_at/updated_at defaults) on
+    # flush, so reading them from an AsyncSession never triggers a lazy load
+    __mapper_args__ = {"eager_defaults": True}
 
 
-def get_db():
+async def get_db():
     """
-    Dependency function to get database session.
+    Dependency function to get an async database session.
 
     Usage in FastAPI endpoints:
         @app.get("/items")
-        def read_items(db: Session = Depends(get_db)):
-            return db.query(Item).all()
+        async def read_items(db: AsyncSession = Depends(get_db)):
+            result = await db.execute(select(Item))
+            return result.scalars().all()
 
     Yields:
-        Session: SQLAlchemy database session
+        AsyncSession: SQLAlchemy async database session
     """
-    db = SessionLocal()
-    try:
+    get_async_engine()
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
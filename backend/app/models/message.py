@@ -2,13 +2,16 @@
 Message model for storing Slack messages and other chat messages.
 """
 from datetime import datetime
+from typing import Optional
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
 
 from app.models.base import Base
 
 
-class Message(Base):
+class Message(Base, kw_only=True):
     """
     Message model representing a chat message (e.g., from Slack DMs).
 
@@ -28,31 +31,37 @@ class Message(Base):
     """
 
     __tablename__ = "messages"
+    # "unprocessed since T" sweeps seek a single B-tree on (processed, timestamp)
+    __table_args__ = (
+        Index("ix_messages_processed_timestamp", "processed", "timestamp"),
+    )
 
     # Primary key
-    id = Column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True, init=False)
 
     # External identifiers
-    external_id = Column(String(500), nullable=False, unique=True, index=True)
-    platform = Column(String(50), nullable=False, index=True)
-    channel_id = Column(String(500), nullable=False, index=True)
+    external_id: Mapped[str] = mapped_column(String(500), unique=True, index=True)
+    platform: Mapped[str] = mapped_column(String(50), index=True)
+    channel_id: Mapped[str] = mapped_column(String(500), index=True)
 
     # User information
-    user_id = Column(String(500), nullable=False)
-    user_name = Column(String(500), nullable=True)
+    user_id: Mapped[str] = mapped_column(String(500))
+    user_name: Mapped[Optional[str]] = mapped_column(String(500), default=None)
 
     # Message content
-    content = Column(Text, nullable=False)
+    content: Mapped[str] = mapped_column(Text)
 
     # Message metadata
-    timestamp = Column(DateTime, nullable=False, index=True)
-    processed = Column(Boolean, nullable=False, default=False, index=True)
-    is_actionable = Column(Boolean, nullable=True)
+    timestamp: Mapped[datetime] = mapped_column(DateTime)
+    processed: Mapped[bool] = mapped_column(Boolean, default=False)
+    is_actionable: Mapped[Optional[bool]] = mapped_column(Boolean, default=None)
 
     # Timestamps
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
-    updated_at = Column(
-        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), index=True, init=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), onupdate=func.now(), init=False
     )
 
     def __repr__(self):
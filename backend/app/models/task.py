@@ -5,8 +5,10 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import Column, DateTime, Float, Integer, String, Text
-from sqlalchemy.orm import validates
+from sqlalchemy import CheckConstraint, DateTime, Float, Integer, String, Text
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
 
 from app.models.base import Base
 
@@ -19,7 +21,11 @@ class TaskStatus(str, Enum):
     DONE = "done"
 
 
-class Task(Base):
+# Allowed status values, computed once at import (ordered to match TaskStatus members)
+_TASK_STATUS_VALUES = tuple(s.value for s in TaskStatus)
+
+
+class Task(Base, kw_only=True):
     """
     Task model representing an inferred task from messages or transcripts.
 
@@ -41,58 +47,63 @@ class Task(Base):
     """
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        CheckConstraint(
+            "confidence_score BETWEEN 0 AND 100", name="ck_tasks_confidence_score"
+        ),
+        CheckConstraint(
+            "priority BETWEEN 1 AND 5 OR priority IS NULL", name="ck_tasks_priority"
+        ),
+    )
 
     # Primary key
-    id = Column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True, init=False)
 
     # Task content
-    title = Column(String(500), nullable=False)
-    description = Column(Text, nullable=True)
-    context = Column(Text, nullable=True)
+    title: Mapped[str] = mapped_column(String(500))
+    description: Mapped[Optional[str]] = mapped_column(Text, default=None)
+    context: Mapped[Optional[str]] = mapped_column(Text, default=None)
 
     # Task metadata
-    status = Column(
-        String(20), nullable=False, default=TaskStatus.TODO.value, index=True
+    # Plain value strings ("done") are also accepted on assignment; since
+    # TaskStatus is a str Enum they compare equal, and loaded rows always
+    # come back as TaskStatus members
+    status: Mapped[TaskStatus] = mapped_column(
+        SQLEnum(
+            TaskStatus,
+            name="task_status",
+            native_enum=False,
+            create_constraint=True,
+            length=20,
+            # Reject unknown status strings via the type's O(1) lookup before they hit the DB
+            validate_strings=True,
+            # Store enum values ("todo"), not member names ("TODO")
+            values_callable=lambda statuses: list(_TASK_STATUS_VALUES),
+        ),
+        default=TaskStatus.TODO,
+        index=True,
     )
-    priority = Column(Integer, nullable=True, default=3)
-    confidence_score = Column(Float, nullable=False, default=0.0)
+    priority: Mapped[Optional[int]] = mapped_column(Integer, default=3)
+    confidence_score: Mapped[float] = mapped_column(Float, default=0.0)
 
     # Source tracking
-    source_type = Column(String(50), nullable=False, index=True)
-    source_id = Column(String(500), nullable=True, index=True)
+    source_type: Mapped[str] = mapped_column(String(50), index=True)
+    source_id: Mapped[Optional[str]] = mapped_column(String(500), default=None, index=True)
 
     # Dates
-    due_date = Column(DateTime, nullable=True)
-    inferred_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    completed_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
-    updated_at = Column(
-        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    due_date: Mapped[Optional[datetime]] = mapped_column(DateTime, default=None)
+    # Optional only at construction: None leaves inferred_at to the server default
+    inferred_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=False, server_default=func.now(), default=None
+    )
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, default=None)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), index=True, init=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), onupdate=func.now(), init=False
     )
-
-    @validates("status")
-    def validate_status(self, key, value):
-        """Validate status is one of allowed values."""
-        if value not in [s.value for s in TaskStatus]:
-            raise ValueError(
-                f"Invalid status: {value}. Must be one of: {[s.value for s in TaskStatus]}"
-            )
-        return value
-
-    @validates("confidence_score")
-    def validate_confidence_score(self, key, value):
-        """Validate confidence score is between 0 and 100."""
-        if value < 0 or value > 100:
-            raise ValueError(f"Confidence score must be between 0 and 100, got: {value}")
-        return value
-
-    @validates("priority")
-    def validate_priority(self, key, value):
-        """Validate priority is between 1 and 5."""
-        if value is not None and (value < 1 or value > 5):
-            raise ValueError(f"Priority must be between 1 and 5, got: {value}")
-        return value
 
     def __repr__(self):
         """String representation of Task."""
-        return f"<Task(id={self.id}, title='{self.title}', status='{self.status}', confidence={self.confidence_score})>"
+        return f"<Task(id={self.id}, title='{self.title}', status='{getattr(self.status, 'value', self.status)}', confidence={self.confidence_score})>"
@@ -2,13 +2,16 @@
 Transcript model for storing Google Meet and other meeting transcripts.
 """
 from datetime import datetime
+from typing import Optional
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
 
 from app.models.base import Base
 
 
-class Transcript(Base):
+class Transcript(Base, kw_only=True):
     """
     Transcript model representing a meeting transcript (e.g., from Google Meet).
 
@@ -29,34 +32,40 @@ class Transcript(Base):
     """
 
     __tablename__ = "transcripts"
+    # "unprocessed since T" sweeps seek a single B-tree on (processed, start_time)
+    __table_args__ = (
+        Index("ix_transcripts_processed_start_time", "processed", "start_time"),
+    )
 
     # Primary key
-    id = Column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True, init=False)
 
     # External identifiers
-    external_id = Column(String(500), nullable=False, unique=True, index=True)
-    platform = Column(String(50), nullable=False, index=True)
+    external_id: Mapped[str] = mapped_column(String(500), unique=True, index=True)
+    platform: Mapped[str] = mapped_column(String(50), index=True)
 
     # Meeting metadata
-    meeting_title = Column(String(1000), nullable=False)
-    meeting_url = Column(Text, nullable=True)
-    participants = Column(Text, nullable=True)
-    duration_minutes = Column(Integer, nullable=True)
+    meeting_title: Mapped[str] = mapped_column(String(1000))
+    meeting_url: Mapped[Optional[str]] = mapped_column(Text, default=None)
+    participants: Mapped[Optional[str]] = mapped_column(Text, default=None)
+    duration_minutes: Mapped[Optional[int]] = mapped_column(Integer, default=None)
 
     # Transcript content
-    content = Column(Text, nullable=False)
+    content: Mapped[str] = mapped_column(Text)
 
     # Meeting times
-    start_time = Column(DateTime, nullable=False, index=True)
-    end_time = Column(DateTime, nullable=True)
+    start_time: Mapped[datetime] = mapped_column(DateTime)
+    end_time: Mapped[Optional[datetime]] = mapped_column(DateTime, default=None)
 
     # Processing status
-    processed = Column(Boolean, nullable=False, default=False, index=True)
+    processed: Mapped[bool] = mapped_column(Boolean, default=False)
 
     # Timestamps
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
-    updated_at = Column(
-        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), index=True, init=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), onupdate=func.now(), init=False
     )
 
     def __repr__(self):
@@ -5,21 +5,22 @@ Database initialization script.
 Creates all database tables and optionally seeds with test data.
 
 Usage:
-    python scripts/init_db.py [--seed]
+    python scripts/init_db.py [--seed] [--bulk N]
 """
 import argparse
 import sys
+import uuid
 from pathlib import Path
 
 # Add parent directory to path to import app modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from app.config import settings
 from app.models.base import Base, engine
 from app.models.message import Message
-from app.models.task import Task, TaskStatus
+from app.models.task import Task
 from app.models.transcript import Transcript
 
 
@@ -30,48 +31,64 @@ def create_tables():
     print(f"✓ Database tables created successfully at: {settings.DATABASE_URL}")
 
 
-def seed_test_data():
-    """Seed database with test data for development."""
+def seed_test_data() -> bool:
+    """
+    Seed database with test data for development.
+
+    Returns:
+        bool: True if test data was inserted, False if it was already present
+    """
+    from sqlalchemy import insert, select
     from sqlalchemy.orm import Session
 
     print("\nSeeding test data...")
 
-    with Session(engine) as session:
+    # Capture the seed timestamp once so all rows share the same reference time
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+    with Session(engine) as session, session.begin():
+        # Skip if a previous run already seeded the database (keyed on the seed
+        # rows themselves, since --bulk also writes to messages)
+        seeded = select(Message.id).where(Message.external_id == "slack_msg_001")
+        if session.scalar(seeded) is not None:
+            print("✓ Test data already present, skipping")
+            return False
+
         # Create test tasks
         test_tasks = [
-            Task(
+            dict(
                 title="Send Q4 report to stakeholders",
                 description="Compile Q4 performance metrics and send to all stakeholders by EOD",
-                status=TaskStatus.TODO.value,
+                status="todo",
                 confidence_score=85.5,
                 source_type="slack",
                 source_id="slack_msg_001",
-                due_date=datetime.utcnow() + timedelta(days=1),
-                inferred_at=datetime.utcnow(),
+                due_date=now + timedelta(days=1),
+                inferred_at=now,
                 context="From Slack DM with Sarah: 'Can you send the Q4 report by tomorrow?'",
                 priority=1,
             ),
-            Task(
+            dict(
                 title="Review PR #123 for new feature",
                 description="Code review for authentication feature implementation",
-                status=TaskStatus.IN_PROGRESS.value,
+                status="in_progress",
                 confidence_score=92.0,
                 source_type="slack",
                 source_id="slack_msg_002",
-                due_date=datetime.utcnow() + timedelta(hours=6),
-                inferred_at=datetime.utcnow(),
+                due_date=now + timedelta(hours=6),
+                inferred_at=now,
                 context="From Slack: 'Hey, could you review my PR when you get a chance?'",
                 priority=2,
             ),
-            Task(
+            dict(
                 title="Schedule team sync for next week",
                 description="Find a time for the team to sync on project progress",
-                status=TaskStatus.DONE.value,
+                status="done",
                 confidence_score=78.0,
                 source_type="google_meet",
                 source_id="meet_transcript_001",
-                completed_at=datetime.utcnow() - timedelta(hours=2),
-                inferred_at=datetime.utcnow() - timedelta(days=1),
+                completed_at=now - timedelta(hours=2),
+                inferred_at=now - timedelta(days=1),
                 context="From team meeting: 'Let's schedule a sync next week'",
                 priority=3,
             ),
@@ -79,36 +96,36 @@ def seed_test_data():
 
         # Create test messages
         test_messages = [
-            Message(
+            dict(
                 external_id="slack_msg_001",
                 platform="slack",
                 channel_id="D12345678",
                 user_id="U98765432",
                 user_name="Sarah Johnson",
                 content="Hey! Can you send me the Q4 report by tomorrow? The board meeting is on Wednesday.",
-                timestamp=datetime.utcnow() - timedelta(hours=3),
+                timestamp=now - timedelta(hours=3),
                 processed=True,
                 is_actionable=True,
             ),
-            Message(
+            dict(
                 external_id="slack_msg_002",
                 platform="slack",
                 channel_id="D87654321",
                 user_id="U11111111",
                 user_name="Alex Chen",
                 content="Hey, could you review my PR when you get a chance? It's for the new auth feature.",
-                timestamp=datetime.utcnow() - timedelta(hours=1),
+                timestamp=now - timedelta(hours=1),
                 processed=True,
                 is_actionable=True,
             ),
-            Message(
+            dict(
                 external_id="slack_msg_003",
                 platform="slack",
                 channel_id="D12345678",
                 user_id="U98765432",
                 user_name="Sarah Johnson",
                 content="Thanks for the update! Looks great.",
-                timestamp=datetime.utcnow() - timedelta(minutes=30),
+                timestamp=now - timedelta(minutes=30),
                 processed=True,
                 is_actionable=False,
             ),
@@ -116,7 +133,7 @@ def seed_test_data():
 
         # Create test transcript
         test_transcripts = [
-            Transcript(
+            dict(
                 external_id="meet_transcript_001",
                 platform="google_meet",
                 meeting_title="Weekly Team Sync - Product Team",
@@ -134,24 +151,91 @@ Maria: I can review it after this meeting. Also, we should schedule another sync
 John: Great idea. Let's do that. I'll send out a calendar invite.
                 """.strip(),
                 duration_minutes=30,
-                start_time=datetime.utcnow() - timedelta(days=1, hours=2),
-                end_time=datetime.utcnow() - timedelta(days=1, hours=1, minutes=30),
+                start_time=now - timedelta(days=1, hours=2),
+                end_time=now - timedelta(days=1, hours=1, minutes=30),
                 processed=True,
             ),
         ]
 
-        # Add all test data
-        session.add_all(test_tasks)
-        session.add_all(test_messages)
-        session.add_all(test_transcripts)
-
-        # Commit transaction
-        session.commit()
+        # Bulk insert all test data in a single transaction
+        session.execute(insert(Task), test_tasks)
+        session.execute(insert(Message), test_messages)
+        session.execute(insert(Transcript), test_transcripts)
 
         print(f"✓ Seeded {len(test_tasks)} tasks")
         print(f"✓ Seeded {len(test_messages)} messages")
         print(f"✓ Seeded {len(test_transcripts)} transcripts")
 
+    return True
+
+
+def seed_bulk_messages(count: int):
+    """
+    Insert synthetic messages for benchmarking via raw DBAPI executemany.
+
+    The rows have a fixed shape, so they are pre-materialized as tuples and
+    sent in one transaction, bypassing the ORM entirely.
+
+    Args:
+        count: Number of messages to insert
+    """
+    print(f"\nInserting {count} synthetic messages...")
+
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    run_id = uuid.uuid4().hex[:8]  # Keeps external_id unique across runs
+    rows = [
+        (
+            f"bulk_{run_id}_{i}",
+            "slack",
+            f"D{i % 100:08d}",
+            f"U{i % 50:08d}",
+            f"Bulk User {i % 50}",
+            f"Synthetic benchmark message #{i}",
+            (now - timedelta(seconds=i)).strftime("%Y-%m-%d %H:%M:%S.%f"),
+            False,
+        )
+        for i in range(count)
+    ]
+
+    placeholder = "?" if engine.dialect.paramstyle == "qmark" else "%s"
+    sql = (
+        "INSERT INTO messages "
+        "(external_id, platform, channel_id, user_id, user_name, content, timestamp, processed) "
+        f"VALUES ({', '.join([placeholder] * 8)})"
+    )
+
+    conn = engine.raw_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.executemany(sql, rows)
+        conn.commit()
+    finally:
+        conn.close()
+
+    print(f"✓ Inserted {count} messages")
+
+
+def positive_int(value: str) -> int:
+    """
+    Argparse type accepting only integers greater than zero.
+
+    Args:
+        value: Raw command-line value
+
+    Returns:
+        int: Parsed positive integer
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not a positive integer
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got: {number}")
+    return number
+
 
 def main():
     """Main entry point."""
@@ -161,6 +245,12 @@ def main():
         action="store_true",
         help="Seed database with test data",
     )
+    parser.add_argument(
+        "--bulk",
+        type=positive_int,
+        metavar="N",
+        help="Insert N synthetic messages for benchmarking",
+    )
     args = parser.parse_args()
 
     print("=" * 60)
@@ -178,11 +268,17 @@ def main():
 
     # Seed test data if requested
     if args.seed:
-        seed_test_data()
-        print("\n✓ Database initialized with test data")
+        if seed_test_data():
+            print("\n✓ Database initialized with test data")
+        else:
+            print("\n✓ Database initialized (test data already present)")
     else:
         print("\n✓ Database initialized (use --seed to add test data)")
 
+    # Insert synthetic benchmark data if requested
+    if args.bulk:
+        seed_bulk_messages(args.bulk)
+
     print("=" * 60)
 
 
@@ -0,0 +1,81 @@
+"""
+Tests for the database initialization script (scripts/init_db.py).
+"""
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from app.models import Message, Task, Transcript
+
+INIT_DB_PATH = Path(__file__).parent.parent / "scripts" / "init_db.py"
+
+
+@pytest.fixture
+def init_db(tmp_path, monkeypatch):
+    """Load init_db as a module, pointed at a fresh SQLite file in tmp_path."""
+    spec = importlib.util.spec_from_file_location("init_db", INIT_DB_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'lotus.db'}")
+    monkeypatch.setattr(module, "engine", engine)
+    monkeypatch.chdir(tmp_path)
+    yield module
+    engine.dispose()
+
+
+def run(init_db, monkeypatch, *args):
+    """Run init_db's CLI entry point with the given arguments."""
+    monkeypatch.setattr(sys, "argv", ["init_db.py", *args])
+    init_db.main()
+
+
+def row_counts(init_db):
+    """Return (tasks, messages, transcripts) row counts."""
+    with Session(init_db.engine) as session:
+        return tuple(
+            session.scalar(select(func.count(model.id)))
+            for model in (Task, Message, Transcript)
+        )
+
+
+def test_seed_twice_is_idempotent(init_db, monkeypatch):
+    """Running --seed twice leaves exactly one copy of the seed data."""
+    run(init_db, monkeypatch, "--seed")
+    run(init_db, monkeypatch, "--seed")
+
+    assert row_counts(init_db) == (3, 3, 1)
+
+
+def test_seed_reports_whether_it_inserted(init_db):
+    """seed_test_data returns True on first run and False once seeded."""
+    init_db.create_tables()
+
+    assert init_db.seed_test_data() is True
+    assert init_db.seed_test_data() is False
+
+
+def test_bulk_inserts_requested_rows(init_db, monkeypatch):
+    """--bulk N inserts N messages and nothing else."""
+    run(init_db, monkeypatch, "--bulk", "25")
+
+    assert row_counts(init_db) == (0, 25, 0)
+
+
+def test_seed_after_bulk_still_seeds(init_db, monkeypatch):
+    """Bulk messages don't make --seed think the seed data is present."""
+    run(init_db, monkeypatch, "--bulk", "5")
+    run(init_db, monkeypatch, "--seed")
+
+    assert row_counts(init_db) == (3, 8, 1)
+
+
+@pytest.mark.parametrize("value", ["0", "-5", "many"])
+def test_bulk_rejects_non_positive_values(init_db, monkeypatch, value):
+    """--bulk only accepts integers greater than zero."""
+    with pytest.raises(SystemExit):
+        run(init_db, monkeypatch, "--bulk", value)